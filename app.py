@@ -1,7 +1,9 @@
+import orjson
+import altair as alt
 import streamlit as st
 import sqlite3
 import pandas as pd
-from db_connection import get_connection as db_get_connection
+from db_connection import get_readonly_connection
 
 # -------------------------
 # PAGE CONFIG
@@ -17,14 +19,84 @@ st.set_page_config(
 # -------------------------
 # HELPER FUNCTION
 # -------------------------
-def run_query(query, params=None):
-    conn = db_get_connection()
-    return pd.read_sql(query, conn, params=params)
+# Dashboard data only changes when the ETL runs, so query results are
+# cached. Aggregates keep a long TTL; filtered lookups refresh sooner.
+CACHE_TTL = 300
+FRESH_TTL = 60
+
+
+@st.cache_resource
+def get_connection():
+    # One shared read-only handle per server process keeps SQLite's page
+    # cache warm across queries and reruns; mmap serves hot pages without
+    # read() syscalls.
+    conn = get_readonly_connection(check_same_thread=False)
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-131072")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA query_only=1")
+    return conn
+
+
+def _fetch(query, params):
+    cursor = get_connection().execute(query, params)
+    return [col[0] for col in cursor.description], cursor.fetchall()
+
+
+# Raw rows are cached per (query, params) and shared by run_query and
+# run_row, so the same SQL is only executed once per TTL window.
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def _cached_fetch(query, params):
+    return _fetch(query, params)
+
+
+@st.cache_data(ttl=FRESH_TTL, show_spinner=False)
+def _fresh_fetch(query, params):
+    return _fetch(query, params)
+
+
+def run_query(query, params=None, fresh=False):
+    fetch = _fresh_fetch if fresh else _cached_fetch
+    columns, rows = fetch(query, tuple(params or ()))
+    return pd.DataFrame.from_records(rows, columns=columns)
+
+
+def run_row(query, params=None):
+    """Fetch a single row as a tuple, skipping DataFrame construction."""
+    return _cached_fetch(query, tuple(params or ()))[1][0]
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def explorer_filters():
+    """Airline and status options for the Flights Explorer."""
+    airlines, statuses = get_connection().execute("""
+        SELECT
+            (SELECT json_group_array(code)
+             FROM (SELECT code FROM airlines ORDER BY code)),
+            (SELECT json_group_array(name)
+             FROM (SELECT name FROM status_codes ORDER BY status_id))
+    """).fetchone()
+    return orjson.loads(airlines), orjson.loads(statuses)
+
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def status_counts():
+    """Flight count per status name."""
+    return dict(get_connection().execute("""
+        SELECT s.name, COUNT(*)
+        FROM flights f
+        LEFT JOIN status_codes s ON s.status_id = f.status_id
+        GROUP BY f.status_id
+    """).fetchall())
 
 # -------------------------
 # SIDEBAR
 # -------------------------
 st.sidebar.title("✈️ Flight Dashboard")
+if st.sidebar.button("🔄 Refresh data"):
+    st.cache_data.clear()
+    # The Explorer keeps its last result in session state; rebuild it too
+    st.session_state.pop("flights_df", None)
 page = st.sidebar.radio(
     "Navigate",
     [
@@ -45,22 +117,28 @@ if page == "Overview":
 
     col1, col2, col3, col4 = st.columns(4)
 
-    col1.metric("Total Flights", run_query("SELECT COUNT(*) c FROM flights")["c"][0])
-    col2.metric("Total Aircraft", run_query("SELECT COUNT(*) c FROM aircraft")["c"][0])
-    col3.metric("Total Airports", run_query("SELECT COUNT(*) c FROM airport")["c"][0])
-    col4.metric("Airlines", run_query(
-        "SELECT COUNT(DISTINCT airline_code) c FROM flights WHERE airline_code IS NOT NULL"
-    )["c"][0])
+    flights, aircraft, airports, airlines = run_row("""
+        SELECT
+            (SELECT COUNT(*) FROM flights) AS flights,
+            (SELECT COUNT(*) FROM aircraft) AS aircraft,
+            (SELECT COUNT(*) FROM airport) AS airports,
+            (SELECT COUNT(DISTINCT airline_code) FROM flights
+             WHERE airline_code IS NOT NULL) AS airlines
+    """)
+
+    col1.metric("Total Flights", flights)
+    col2.metric("Total Aircraft", aircraft)
+    col3.metric("Total Airports", airports)
+    col4.metric("Airlines", airlines)
 
     st.divider()
 
     st.subheader("Flight Status Distribution")
-    status_df = run_query("""
-        SELECT status, COUNT(*) count
-        FROM flights
-        GROUP BY status
-    """)
-    st.bar_chart(status_df.set_index("status"))
+    status_chart = alt.Chart(alt.Data(values=[
+        {"status": status, "count": count}
+        for status, count in status_counts().items()
+    ])).mark_bar().encode(x="status:N", y="count:Q")
+    st.altair_chart(status_chart, use_container_width=True)
 
 # -------------------------
 # FLIGHTS EXPLORER
@@ -68,46 +146,44 @@ if page == "Overview":
 elif page == "Flights Explorer":
     st.title("🛫 Flights Explorer")
 
-    col1, col2, col3 = st.columns(3)
+    airlines, statuses = explorer_filters()
+
+    # Widgets inside a form only trigger a rerun when "Apply" is pressed
+    with st.form("flights_filter"):
+        col1, col2, col3 = st.columns(3)
+
+        airline = col1.selectbox("Airline", ["All"] + airlines)
 
-    airline = col1.selectbox(
-        "Airline",
-        ["All"] + run_query(
-            "SELECT DISTINCT airline_code FROM flights WHERE airline_code IS NOT NULL"
-        )["airline_code"].tolist()
-    )
+        status = col2.selectbox("Status", ["All"] + statuses)
 
-    status = col2.selectbox(
-        "Status",
-        ["All"] + run_query(
-            "SELECT DISTINCT status FROM flights WHERE status IS NOT NULL"
-        )["status"].tolist()
-    )
+        limit = col3.slider("Records", 10, 500, 50)
 
-    limit = col3.slider("Records", 10, 500, 50)
+        submitted = st.form_submit_button("Apply")
 
-    query = """
-        SELECT flight_number, origin_iata, destination_iata,
-               scheduled_departure, scheduled_arrival,
-               status, airline_code
-        FROM flights
-        WHERE 1=1
-    """
-    params = []
+    if submitted or "flights_df" not in st.session_state:
+        query = """
+            SELECT flight_number, origin_iata, destination_iata,
+                   scheduled_departure, scheduled_arrival,
+                   status, airline_code
+            FROM flights
+            WHERE 1=1
+        """
+        params = []
+
+        if airline != "All":
+            query += " AND airline_code = ?"
+            params.append(airline)
 
-    if airline != "All":
-        query += " AND airline_code = ?"
-        params.append(airline)
+        if status != "All":
+            query += " AND status_id = (SELECT status_id FROM status_codes WHERE name = ?)"
+            params.append(status)
 
-    if status != "All":
-        query += " AND status = ?"
-        params.append(status)
+        query += " ORDER BY scheduled_departure DESC LIMIT ?"
+        params.append(limit)
 
-    query += " ORDER BY scheduled_departure DESC LIMIT ?"
-    params.append(limit)
+        st.session_state.flights_df = run_query(query, params, fresh=True)
 
-    df = run_query(query, params)
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(st.session_state.flights_df, use_container_width=True)
 
 # -------------------------
 # AIRCRAFT ANALYTICS
@@ -117,11 +193,8 @@ elif page == "Aircraft Analytics":
 
     st.subheader("Flights by Aircraft Model")
     model_df = run_query("""
-        SELECT a.model, COUNT(f.flight_id) total_flights
-        FROM flights f
-        JOIN aircraft a ON f.aircraft_registration = a.registration
-        WHERE a.model IS NOT NULL
-        GROUP BY a.model
+        SELECT model, total_flights
+        FROM model_flight_counts
         ORDER BY total_flights DESC
     """)
     st.bar_chart(model_df.set_index("model"))
@@ -140,10 +213,9 @@ elif page == "Airport Analytics":
     with col1:
         st.subheader("Top Departure Airports")
         dep_df = run_query("""
-            SELECT ap.name, COUNT(*) departures
-            FROM flights f
-            JOIN airport ap ON f.origin_iata = ap.iata_code
-            GROUP BY ap.name
+            SELECT name, departures
+            FROM airport_traffic
+            WHERE departures > 0
             ORDER BY departures DESC
             LIMIT 10
         """)
@@ -152,10 +224,9 @@ elif page == "Airport Analytics":
     with col2:
         st.subheader("Top Arrival Airports")
         arr_df = run_query("""
-            SELECT ap.name, COUNT(*) arrivals
-            FROM flights f
-            JOIN airport ap ON f.destination_iata = ap.iata_code
-            GROUP BY ap.name
+            SELECT name, arrivals
+            FROM airport_traffic
+            WHERE arrivals > 0
             ORDER BY arrivals DESC
             LIMIT 10
         """)
@@ -168,14 +239,8 @@ elif page == "Airline Performance":
     st.title("🏷️ Airline Performance")
 
     perf_df = run_query("""
-        SELECT 
-            airline_code,
-            SUM(CASE WHEN status IN ('Departed','Arrived') THEN 1 ELSE 0 END) AS on_time,
-            SUM(CASE WHEN status = 'Delayed' THEN 1 ELSE 0 END) AS delayed,
-            SUM(CASE WHEN status IN ('Canceled','CanceledUncertain') THEN 1 ELSE 0 END) AS cancelled
-        FROM flights
-        WHERE airline_code IS NOT NULL
-        GROUP BY airline_code
+        SELECT airline_code, on_time, delayed, cancelled
+        FROM airline_status_rollup
         ORDER BY airline_code
     """)
 
@@ -204,7 +269,7 @@ elif page == "Delays & Cancellations":
         cancelled_df = run_query("""
             SELECT flight_number, origin_iata, destination_iata, scheduled_departure
             FROM flights
-            WHERE status IN ('Canceled','CanceledUncertain')
+            WHERE is_cancelled = 1
             ORDER BY scheduled_departure DESC
             LIMIT 20
         """)
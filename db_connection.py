@@ -1,9 +1,14 @@
 # db_connection.py
 import sqlite3
 import os
+from pathlib import Path
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DB_PATH = os.path.join(BASE_DIR, "airtracker_collection.db")
 
-def get_connection():
-    return sqlite3.connect(DB_PATH)
+def get_connection(**kwargs):
+    return sqlite3.connect(DB_PATH, **kwargs)
+
+def get_readonly_connection(**kwargs):
+    uri = f"{Path(DB_PATH).as_uri()}?mode=ro"
+    return sqlite3.connect(uri, uri=True, **kwargs)
@@ -31,7 +31,27 @@ CREATE TABLE IF NOT EXISTS flights (
     scheduled_arrival TEXT,
     actual_arrival TEXT,
     status TEXT,
-    airline_code TEXT
+    airline_code TEXT,
+    status_id INTEGER REFERENCES status_codes (status_id),
+    is_cancelled INTEGER GENERATED ALWAYS AS (status_id IN (4, 5)) VIRTUAL
+);
+
+CREATE TABLE IF NOT EXISTS status_codes (
+    status_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT UNIQUE
+);
+
+-- Fixed ids for the statuses the dashboard filters on; any other status
+-- reported by the API is appended by the ETL.
+INSERT OR IGNORE INTO status_codes (status_id, name) VALUES
+    (1, 'Departed'),
+    (2, 'Arrived'),
+    (3, 'Delayed'),
+    (4, 'Canceled'),
+    (5, 'CanceledUncertain');
+
+CREATE TABLE IF NOT EXISTS airlines (
+    code TEXT PRIMARY KEY
 );
 
 CREATE TABLE IF NOT EXISTS airport_delays (
@@ -44,3 +64,30 @@ CREATE TABLE IF NOT EXISTS airport_delays (
     median_delay_min INTEGER,
     canceled_flights INTEGER
 );
+
+-- Looked up per (airport, day) to skip days that were already loaded
+CREATE INDEX IF NOT EXISTS idx_airport_delays_airport_date
+    ON airport_delays (airport_iata, delay_date);
+
+CREATE TABLE IF NOT EXISTS airline_status_rollup (
+    airline_code TEXT PRIMARY KEY,
+    on_time INTEGER,
+    delayed INTEGER,
+    cancelled INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS airport_traffic (
+    name TEXT PRIMARY KEY,
+    departures INTEGER,
+    arrivals INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_airport_traffic_dep ON airport_traffic (departures DESC);
+CREATE INDEX IF NOT EXISTS idx_airport_traffic_arr ON airport_traffic (arrivals DESC);
+
+CREATE TABLE IF NOT EXISTS model_flight_counts (
+    model TEXT PRIMARY KEY,
+    total_flights INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_mfc_total ON model_flight_counts (total_flights DESC);
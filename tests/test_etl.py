@@ -0,0 +1,38 @@
+import pandas as pd
+
+import etl
+
+
+def test_delay_metrics_when_no_airport_has_flights():
+    # Every window rejected (or a quiet day): the frames are empty
+    frames = {
+        iata: etl.flights_to_dataframe(etl.merge_flight_windows([None, None]), iata)
+        for iata in ["DEL", "BOM"]
+    }
+    df = pd.concat(frames.values(), ignore_index=True)
+    df["airport_iata"] = pd.Series(dtype=object)
+
+    metrics = etl.compute_airport_delay_metrics(df, "2024-12-14", ["DEL", "BOM"])
+
+    assert metrics["airport_iata"].tolist() == ["DEL", "BOM"]
+    assert (metrics["delay_date"] == "2024-12-14").all()
+    assert (metrics[["total_flights", "delayed_flights", "canceled_flights"]] == 0).all().all()
+
+
+def test_unnumbered_flights_get_distinct_ids():
+    def flight(**fields):
+        return {
+            "departure": {"scheduledTime": {"utc": "2024-12-14 01:00Z"}},
+            "arrival": {"airport": {"iata": "BOM"}},
+            **fields
+        }
+
+    data = etl.merge_flight_windows([{
+        "departures": [flight(), flight(), flight(callSign="IGO12"), flight(number="6E 1")],
+        "arrivals": []
+    }])
+    df = etl.flights_to_dataframe(data, "DEL")
+
+    assert len(df) == 4
+    assert df["flight_id"].is_unique
+    assert "IGO12_2024-12-14 01:00Z" in df["flight_id"].tolist()